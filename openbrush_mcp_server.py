@@ -4,635 +4,1054 @@ MCP Server for Open Brush API
 Exposes all Open Brush commands as MCP tools
 """
 
+import os
+import re
+import json
+import math
+import time
+import hashlib
 import httpx
-from typing import Any, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.prompts import base
 
 # Configuration
 API_BASE_URL = "http://localhost:40074"
 
+# Compact responses: tools return {"s": status, "c": command, "ms": latency}
+# instead of "✓ Command executed: ..." strings. Opt-in via environment or set_compact_responses.
+COMPACT_RESPONSES = os.environ.get("OPENBRUSH_COMPACT_RESPONSES", "").lower() in ("1", "true", "yes")
+
+# Open Brush Media Library, used to validate and hash local files before importing them
+MEDIA_LIBRARY_PATH = os.environ.get(
+    "OPENBRUSH_MEDIA_LIBRARY",
+    os.path.join(os.path.expanduser("~"), "Documents", "Open Brush", "Media Library"),
+)
+MEDIA_FOLDERS = {"model": "Models", "image": "Images", "video": "Videos"}
+
+# Import commands and the kind of widget they create
+IMPORT_COMMANDS = {
+    "model.import": "model",
+    "model.webimport": "model",
+    "import.webmodel": "model",
+    "model.icosaimport": "model",
+    "image.import": "image",
+    "video.import": "video",
+}
+
+# Assets already loaded in the current scene: (kind, content hash / URL / Icosa ID) -> widget index
+ASSET_CACHE: Dict[Tuple[str, str], int] = {}
+# Widgets of each kind in the current scene, None while the count is unknown: at startup
+# (the scene may already hold widgets) until a new scene, and after a load, undo...
+WIDGET_COUNTS: Dict[str, Optional[int]] = {"model": None, "image": None, "video": None}
+# Commands after which widget indices can no longer be tracked
+UNTRACKABLE_COMMANDS = (
+    "load.user", "load.featured", "load.liked", "load.drive", "load.named", "merge.named",
+    "undo", "redo", "selection.delete", "selection.duplicate",
+    "layer.clear", "layer.delete", "model.breakapart",
+)
+# Whether a mirror symmetry is active (selection.duplicate then creates several copies),
+# None until a symmetry mode command has been sent
+SYMMETRY_ACTIVE: Optional[bool] = None
+# File hashes keyed by (path, mtime, size) so unchanged files are hashed only once
+FILE_HASHES: Dict[Tuple[str, float, int], str] = {}
+
+# Affine transform as 3 rows of [a, b, c, translation]
+Affine = List[List[float]]
+
+# Limits for server-side symmetry expansion: everything is sent in one draw.paths GET request
+MAX_SYMMETRY_ORDER = 360
+MAX_SYMMETRY_COPIES = 1000
+MAX_EXPANDED_POINTS = 2000
+
+# Wallpaper group operations in lattice coordinates: (a, b, c, d, tx, ty) maps
+# (x, y) to (a*x + b*y + tx, c*x + d*y + ty), per the International Tables
+_P3 = [(1, 0, 0, 1, 0, 0), (0, -1, 1, -1, 0, 0), (-1, 1, -1, 0, 0, 0)]
+_P4 = [(1, 0, 0, 1, 0, 0), (0, -1, 1, 0, 0, 0), (-1, 0, 0, -1, 0, 0), (0, 1, -1, 0, 0, 0)]
+_PMM = [(1, 0, 0, 1, 0, 0), (-1, 0, 0, 1, 0, 0), (1, 0, 0, -1, 0, 0), (-1, 0, 0, -1, 0, 0)]
+_CENTERING = [(0, 0), (0.5, 0.5)]
+WALLPAPER_GROUPS: Dict[str, Tuple[str, List[Tuple[float, ...]]]] = {
+    "p1": ("rectangular", [(1, 0, 0, 1, 0, 0)]),
+    "p2": ("rectangular", [(1, 0, 0, 1, 0, 0), (-1, 0, 0, -1, 0, 0)]),
+    "pm": ("rectangular", [(1, 0, 0, 1, 0, 0), (-1, 0, 0, 1, 0, 0)]),
+    "pg": ("rectangular", [(1, 0, 0, 1, 0, 0), (-1, 0, 0, 1, 0, 0.5)]),
+    "cm": ("rectangular", [(a, b, c, d, tx + cx, ty + cy)
+                           for (a, b, c, d, tx, ty) in [(1, 0, 0, 1, 0, 0), (-1, 0, 0, 1, 0, 0)]
+                           for (cx, cy) in _CENTERING]),
+    "pmm": ("rectangular", _PMM),
+    "pmg": ("rectangular", [(1, 0, 0, 1, 0, 0), (-1, 0, 0, -1, 0, 0), (-1, 0, 0, 1, 0.5, 0), (1, 0, 0, -1, 0.5, 0)]),
+    "pgg": ("rectangular", [(1, 0, 0, 1, 0, 0), (-1, 0, 0, -1, 0, 0), (-1, 0, 0, 1, 0.5, 0.5), (1, 0, 0, -1, 0.5, 0.5)]),
+    "cmm": ("rectangular", [(a, b, c, d, tx + cx, ty + cy) for (a, b, c, d, tx, ty) in _PMM for (cx, cy) in _CENTERING]),
+    "p4": ("square", _P4),
+    "p4m": ("square", _P4 + [(-1, 0, 0, 1, 0, 0), (0, 1, 1, 0, 0, 0), (1, 0, 0, -1, 0, 0), (0, -1, -1, 0, 0, 0)]),
+    "p4g": ("square", _P4 + [(-1, 0, 0, 1, 0.5, 0.5), (0, -1, -1, 0, 0.5, 0.5), (1, 0, 0, -1, 0.5, 0.5), (0, 1, 1, 0, 0.5, 0.5)]),
+    "p3": ("hexagonal", _P3),
+    "p3m1": ("hexagonal", _P3 + [(0, -1, -1, 0, 0, 0), (-1, 1, 0, 1, 0, 0), (1, 0, 1, -1, 0, 0)]),
+    "p31m": ("hexagonal", _P3 + [(0, 1, 1, 0, 0, 0), (1, -1, 0, -1, 0, 0), (-1, 0, -1, 1, 0, 0)]),
+    "p6": ("hexagonal", _P3 + [(-1, 0, 0, -1, 0, 0), (0, 1, -1, 1, 0, 0), (1, -1, 1, 0, 0, 0)]),
+    "p6m": ("hexagonal", _P3 + [(-1, 0, 0, -1, 0, 0), (0, 1, -1, 1, 0, 0), (1, -1, 1, 0, 0, 0),
+                                (0, -1, -1, 0, 0, 0), (-1, 1, 0, 1, 0, 0), (1, 0, 1, -1, 0, 0),
+                                (0, 1, 1, 0, 0, 0), (1, -1, 0, -1, 0, 0), (-1, 0, -1, 1, 0, 0)]),
+}
+
+# A tool result is either a human-readable string or a compact dict
+ToolResponse = Union[str, Dict[str, Any]]
+
 # Create MCP server
 mcp = FastMCP("openbrush", json_response=True)
 
-def call_openbrush_api(params: Dict[str, Any]) -> Tuple[int, str]:
+def send_command(client: httpx.Client, commandname: str, parameters: Any) -> Tuple[int, str, str, float]:
     """
-    Calls the Open Brush API with the provided parameters
-    Returns: (status_code, url_called)
+    Sends a single command to the Open Brush API using an open client
+    Returns: (status_code, url_called or error, response_body, elapsed_ms)
     """
-    commandname, parameters = params.popitem()
+    start = time.perf_counter()
     try:
-        with httpx.Client(timeout=30.0) as client:
-            url = f"{API_BASE_URL}/api/v1?{commandname}={parameters if parameters is not None else ''}"
-            response = client.get(url)
-            return (response.status_code, url)
+        url = f"{API_BASE_URL}/api/v1?{commandname}={parameters if parameters is not None else ''}"
+        response = client.get(url)
+        return (response.status_code, url, response.text, (time.perf_counter() - start) * 1000)
     except httpx.HTTPError as e:
-        return (-1, f"HTTP Error: {str(e)}")
+        return (-1, f"HTTP Error: {str(e)}", "", (time.perf_counter() - start) * 1000)
     except Exception as e:
-        return (-1, f"Error: {str(e)}")
+        return (-1, f"Error: {str(e)}", "", (time.perf_counter() - start) * 1000)
+
+
+def html_to_text(html: str) -> str:
+    """Strips tags and collapses whitespace so help pages cost fewer tokens"""
+    text = re.sub(r"<(script|style)[^>]*>.*?</\1>", " ", html, flags=re.S | re.I)
+    text = re.sub(r"<[^>]+>", " ", text)
+    return re.sub(r"\s+", " ", text.replace("&nbsp;", " ")).strip()
+
+
+def format_response(tool_name: str, commandname: str, status_code: int,
+                    elapsed_ms: float, body: Optional[str] = None,
+                    index: Optional[int] = None, cached: bool = False) -> ToolResponse:
+    """
+    Builds a tool result, compact dict or verbose string depending on COMPACT_RESPONSES
+    Compact keys: s = HTTP status (-1 on transport error), c = API command (or help page path),
+    ms = latency, b = body (only for commands whose response carries information),
+    verbose strings only show the body for local errors so the default output stays short,
+    i = widget index of an imported asset, hit = asset was duplicated from the scene cache
+    """
+    if COMPACT_RESPONSES:
+        result: Dict[str, Any] = {"s": status_code, "c": commandname, "ms": round(elapsed_ms, 1)}
+        if body:
+            result["b"] = body
+        if index is not None:
+            result["i"] = index
+        if cached:
+            result["hit"] = 1
+        return result
+    detail = ""
+    if index is not None:
+        detail = f" (index {index}{', duplicated from cache' if cached else ''})"
+    if status_code == 200:
+        return f"✓ Command executed: {tool_name}{detail}"
+    elif body:
+        return f"✗ Failed (HTTP {status_code}): {tool_name} - {body}"
+    else:
+        return f"✗ Failed (HTTP {status_code}): {tool_name}"
+
+
+def execute_command(tool_name: str, params: Dict[str, Any], include_body: bool = False) -> ToolResponse:
+    """Calls the Open Brush API and formats the result for the given tool"""
+    commandname, parameters = params.popitem()
+    with httpx.Client(timeout=30.0) as client:
+        status_code, url, body, elapsed_ms = send_command(client, commandname, parameters)
+    track_widgets(commandname, parameters, status_code)
+    return format_response(tool_name, commandname, status_code, elapsed_ms,
+                           html_to_text(body) if include_body and COMPACT_RESPONSES and status_code == 200 else None)
+
+
+def format_batch(statuses: List[int], elapsed_ms: float,
+                 indices: Optional[List[Optional[int]]] = None,
+                 messages: Optional[Dict[int, str]] = None) -> ToolResponse:
+    """
+    Builds a single summary for a sequence of commands
+    Compact keys: n = count, ok = successes, bits = hex bitmap (bit i set when command i
+    returned 200), err = {index: status or error message} for failures,
+    i = widget indices of imported assets
+    """
+    bits = 0
+    errors: Dict[int, Union[int, str]] = {}
+    for i, status_code in enumerate(statuses):
+        if status_code == 200:
+            bits |= 1 << i
+        elif messages and i in messages:
+            errors[i] = messages[i]
+        else:
+            errors[i] = status_code
+    ok = len(statuses) - len(errors)
+    if COMPACT_RESPONSES:
+        result: Dict[str, Any] = {"n": len(statuses), "ok": ok, "bits": format(bits, "x"), "ms": round(elapsed_ms, 1)}
+        if errors:
+            result["err"] = errors
+        if indices is not None:
+            result["i"] = indices
+        return result
+    detail = f", indices {indices}" if indices is not None else ""
+    if not errors:
+        return f"✓ Batch executed: {ok}/{len(statuses)} commands{detail}"
+    else:
+        failed = ", ".join(f"#{i} ({code})" if isinstance(code, str) else f"#{i} (HTTP {code})"
+                           for i, code in errors.items())
+        return f"✗ Batch partially failed: {ok}/{len(statuses)} commands, failed {failed}{detail}"
+
+
+def execute_batch(commands: List[Tuple[str, Any]]) -> ToolResponse:
+    """Runs (command, parameters) pairs sequentially over one connection and summarizes them"""
+    start = time.perf_counter()
+    statuses = []
+    with httpx.Client(timeout=30.0) as client:
+        for commandname, parameters in commands:
+            status_code, url, body, elapsed_ms = send_command(client, commandname, parameters)
+            track_widgets(commandname, parameters, status_code)
+            statuses.append(status_code)
+    return format_batch(statuses, (time.perf_counter() - start) * 1000)
+
+
+### Asset cache
+def reset_assets(known: bool) -> None:
+    """
+    Forgets cached assets
+    known=True after a new scene (no widgets), False when widget indices can no longer be tracked
+    """
+    ASSET_CACHE.clear()
+    for kind in WIDGET_COUNTS:
+        WIDGET_COUNTS[kind] = 0 if known else None
+
+
+def track_widgets(commandname: str, parameters: Any, status_code: int) -> None:
+    """Keeps ASSET_CACHE and WIDGET_COUNTS in sync with a command sent to Open Brush"""
+    global SYMMETRY_ACTIVE
+    if status_code != 200:
+        return
+    if commandname == "new":
+        reset_assets(known=True)
+    elif commandname in UNTRACKABLE_COMMANDS:
+        reset_assets(known=False)
+    elif commandname == "symmetry.mode":
+        SYMMETRY_ACTIVE = str(parameters or "").strip().lower() not in ("", "none", "off")
+    elif commandname in ("symmetry.mirror", "symmetry.multimirror"):
+        SYMMETRY_ACTIVE = True
+    elif commandname in IMPORT_COMMANDS:
+        kind = IMPORT_COMMANDS[commandname]
+        if WIDGET_COUNTS[kind] is not None:
+            WIDGET_COUNTS[kind] += 1
+    elif commandname in ("model.delete", "image.delete", "video.delete"):
+        kind = commandname.split(".")[0]
+        count = WIDGET_COUNTS[kind]
+        if count is None:
+            return
+        try:
+            deleted = int(str(parameters).strip())
+        except ValueError:
+            # Unparseable index (e.g. a list): don't guess which widgets are gone
+            reset_assets(known=False)
+            return
+        for key, index in list(ASSET_CACHE.items()):
+            if key[0] != kind:
+                continue
+            if index == deleted:
+                del ASSET_CACHE[key]
+            elif index > deleted:
+                ASSET_CACHE[key] = index - 1
+        WIDGET_COUNTS[kind] = max(count - 1, 0)
+
+
+def hash_file(path: str) -> str:
+    """Returns the SHA-256 of a file, reusing the previous hash if the file is unchanged"""
+    stat = os.stat(path)
+    signature = (path, stat.st_mtime, stat.st_size)
+    if signature not in FILE_HASHES:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        FILE_HASHES[signature] = digest.hexdigest()
+    return FILE_HASHES[signature]
+
+
+def resolve_asset(commandname: str, location: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Computes the cache key of an asset and validates local files
+    Returns: (cache_key, error) - error is set when the file is missing from the Media Library
+    """
+    if commandname in ("model.webimport", "import.webmodel") or re.match(r"^[A-Za-z][A-Za-z0-9+.-]*://", location):
+        return (f"url:{location}", None)
+    if commandname == "model.icosaimport":
+        return (f"icosa:{location}", None)
+    if os.sep != "\\" and re.match(r"^[A-Za-z]:[\\/]", location):
+        # Windows drive path seen from another OS: can't be checked here, key by name
+        return (f"file:{location}", None)
+    kind = IMPORT_COMMANDS[commandname]
+    # Media Library subpaths may use Windows separators (e.g. Andy\\Andy.obj)
+    relative = location.replace("\\", os.sep)
+    path = relative if os.path.isabs(relative) else os.path.join(MEDIA_LIBRARY_PATH, MEDIA_FOLDERS[kind], relative)
+    try:
+        if os.path.isfile(path):
+            return (f"sha256:{hash_file(path)}", None)
+    except OSError as e:
+        return (None, f"Error: {str(e)}")
+    if os.path.isdir(MEDIA_LIBRARY_PATH):
+        return (None, f"File not found: {path}")
+    # Media Library not reachable from here (e.g. Open Brush on another machine): key by name
+    return (f"file:{location}", None)
+
+
+def import_asset(client: httpx.Client, commandname: str, location: str,
+                 key: Optional[str]) -> Tuple[int, Optional[int], bool, float]:
+    """
+    Imports an asset, or duplicates it when it is already loaded in the scene
+    Videos have no select command in the API, and mirror symmetry makes selection.duplicate
+    create several copies, so both cases always use a full import
+    Returns: (status_code, widget_index, cached, elapsed_ms)
+    """
+    kind = IMPORT_COMMANDS[commandname]
+    count = WIDGET_COUNTS[kind]
+    elapsed_ms = 0.0
+    if (key is not None and count is not None and kind != "video" and SYMMETRY_ACTIVE is False
+            and (kind, key) in ASSET_CACHE):
+        # Clear the selection first so only the cached widget is duplicated
+        status_code, url, body, select_ms = send_command(client, "select.none", None)
+        elapsed_ms += select_ms
+        if status_code == 200:
+            status_code, url, body, select_ms = send_command(client, f"{kind}.select", ASSET_CACHE[(kind, key)])
+            elapsed_ms += select_ms
+        if status_code == 200:
+            status_code, url, body, duplicate_ms = send_command(client, "selection.duplicate", None)
+            elapsed_ms += duplicate_ms
+            if status_code != 200:
+                return (status_code, None, True, elapsed_ms)
+            WIDGET_COUNTS[kind] = count + 1
+            return (status_code, count, True, elapsed_ms)
+        # Stale index or selection failure: forget the entry and import for real
+        del ASSET_CACHE[(kind, key)]
+    status_code, url, body, import_ms = send_command(client, commandname, location)
+    elapsed_ms += import_ms
+    if status_code != 200 or count is None:
+        return (status_code, None, False, elapsed_ms)
+    WIDGET_COUNTS[kind] = count + 1
+    if key is not None:
+        ASSET_CACHE[(kind, key)] = count
+    return (status_code, count, False, elapsed_ms)
+
+
+def execute_import(tool_name: str, commandname: str, location: str) -> ToolResponse:
+    """Validates, deduplicates and imports a single asset"""
+    key, error = resolve_asset(commandname, location)
+    if error is not None:
+        return format_response(tool_name, commandname, -1, 0.0, body=error)
+    with httpx.Client(timeout=30.0) as client:
+        status_code, index, cached, elapsed_ms = import_asset(client, commandname, location, key)
+    return format_response(tool_name, commandname, status_code, elapsed_ms, index=index, cached=cached)
+
+
+def execute_import_many(commandname: str, locations: List[str]) -> ToolResponse:
+    """
+    Imports several assets in order over one connection
+    Local files are validated and hashed concurrently before anything is sent
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        resolved = list(pool.map(lambda location: resolve_asset(commandname, location), locations))
+    statuses = []
+    indices: List[Optional[int]] = []
+    messages: Dict[int, str] = {}
+    with httpx.Client(timeout=30.0) as client:
+        for location, (key, error) in zip(locations, resolved):
+            if error is not None:
+                messages[len(statuses)] = error
+                statuses.append(-1)
+                indices.append(None)
+                continue
+            status_code, index, cached, elapsed_ms = import_asset(client, commandname, location, key)
+            statuses.append(status_code)
+            indices.append(index)
+    return format_batch(statuses, (time.perf_counter() - start) * 1000, indices, messages)
 
     
 @mcp.resource("http://localhost:40074/help/brushes")
 def list_brushes() -> Dict[str, Any]:
     """Lists available brushes in Open Brush"""
+    start = time.perf_counter()
     with httpx.Client(timeout=30.0) as client:
             response =  client.get(f"{API_BASE_URL}/help/brushes")
             url = str(response.url)
             status_code = response.status_code
+    if COMPACT_RESPONSES:
+        brushes = html_to_text(response.text) if status_code == 200 else None
+        return format_response("list_brushes", "help/brushes", status_code,
+                               (time.perf_counter() - start) * 1000, body=brushes)
     if status_code == 200:
         return {"status": "Success", "url": url}
     else:
         return {"status": "Failed to retrieve brush list", "url": url}
 
+### Symmetry expansion
+def rotation(axis: Tuple[float, float, float], angle: float) -> Affine:
+    """Rotation of angle radians around an axis through the origin"""
+    length = math.sqrt(sum(c * c for c in axis))
+    x, y, z = (c / length for c in axis)
+    c, s, t = math.cos(angle), math.sin(angle), 1 - math.cos(angle)
+    return [[t * x * x + c, t * x * y - s * z, t * x * z + s * y, 0.0],
+            [t * x * y + s * z, t * y * y + c, t * y * z - s * x, 0.0],
+            [t * x * z - s * y, t * y * z + s * x, t * z * z + c, 0.0]]
+
+
+def reflection(normal: Tuple[float, float, float]) -> Affine:
+    """Mirror through the plane through the origin with the given normal"""
+    length = math.sqrt(sum(c * c for c in normal))
+    n = [c / length for c in normal]
+    return [[(1.0 if i == j else 0.0) - 2 * n[i] * n[j] for j in range(3)] + [0.0] for i in range(3)]
+
+
+def compose(m: Affine, n: Affine) -> Affine:
+    """Returns the transform applying n then m"""
+    return [[sum(m[i][k] * n[k][j] for k in range(3)) + (m[i][3] if j == 3 else 0.0) for j in range(4)]
+            for i in range(3)]
+
+
+INVERSION: Affine = [[-1.0, 0.0, 0.0, 0.0], [0.0, -1.0, 0.0, 0.0], [0.0, 0.0, -1.0, 0.0]]
+
+
+def close_group(generators: List[Affine]) -> List[Affine]:
+    """Generates every element of a finite point group from its generators"""
+    identity = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]
+    signature = lambda m: tuple(round(v, 6) + 0.0 for row in m for v in row)
+    elements = {signature(identity): identity}
+    pending = [identity]
+    while pending:
+        current = pending.pop()
+        for generator in generators:
+            product = compose(generator, current)
+            if signature(product) not in elements:
+                elements[signature(product)] = product
+                pending.append(product)
+    return list(elements.values())
+
+
+def check_copies(copies: int, max_copies: int) -> None:
+    """Rejects an expansion before its transforms are built"""
+    if copies > max_copies:
+        raise ValueError(f"{copies} copies exceed the maximum of {max_copies} for this request "
+                         f"(at most {MAX_SYMMETRY_COPIES} copies and {MAX_EXPANDED_POINTS} points)")
+
+
+def point_group(group: str, max_copies: int = MAX_SYMMETRY_COPIES) -> List[Affine]:
+    """
+    Transforms of a point group in Schoenflies notation, main axis along Y
+    Cn (radial n-fold), Cnv, Cnh, Dn, Dnh, Dnd, T, Td, Th, O, Oh, I, Ih
+    """
+    polyhedral_orders = {"T": 12, "Td": 24, "Th": 24, "O": 24, "Oh": 48, "I": 60, "Ih": 120}
+    if group in polyhedral_orders:
+        check_copies(polyhedral_orders[group], max_copies)
+    up = (0.0, 1.0, 0.0)
+    phi = (1 + math.sqrt(5)) / 2
+    polyhedral = {
+        "T": [rotation((1, 0, 0), math.pi), rotation((1, 1, 1), 2 * math.pi / 3)],
+        "O": [rotation(up, math.pi / 2), rotation((1, 1, 1), 2 * math.pi / 3)],
+        "I": [rotation((0, 1, phi), 2 * math.pi / 5), rotation((1, 1, 1), 2 * math.pi / 3)],
+    }
+    if group in polyhedral:
+        return close_group(polyhedral[group])
+    if group in ("Td", "Th", "Oh", "Ih"):
+        extra = reflection((1, -1, 0)) if group == "Td" else INVERSION
+        return close_group(polyhedral[group[0]] + [extra])
+    match = re.fullmatch(r"C(\d+)([vh]?)|D(\d+)([hd]?)", group)
+    if not match:
+        raise ValueError(f"Unknown point group: {group}")
+    family = group[0]
+    n = int(match.group(1) or match.group(3))
+    suffix = match.group(2) or match.group(4)
+    if n < 1:
+        raise ValueError(f"Unknown point group: {group}")
+    if n > MAX_SYMMETRY_ORDER:
+        raise ValueError(f"Order {n} exceeds the maximum of {MAX_SYMMETRY_ORDER}")
+    check_copies(n * (2 if family == "D" else 1) * (2 if suffix else 1), max_copies)
+    generators = [rotation(up, 2 * math.pi / n)]
+    if family == "D":
+        generators.append(rotation((1, 0, 0), math.pi))
+    if suffix == "v":
+        generators.append(reflection((0, 0, 1)))
+    elif suffix == "h":
+        generators.append(reflection(up))
+    elif suffix == "d":
+        a = math.pi / (2 * n)
+        generators.append(reflection((-math.sin(a), 0, math.cos(a))))
+    return close_group(generators)
+
+
+def wallpaper_group(group: str, repeats_x: int, repeats_y: int, scale_x: float, scale_y: float,
+                    max_copies: int = MAX_SYMMETRY_COPIES) -> List[Affine]:
+    """Transforms of a wallpaper group tiled repeats_x by repeats_y times in the XY plane"""
+    if group not in WALLPAPER_GROUPS:
+        raise ValueError(f"Unknown wallpaper group: {group}")
+    lattice, operations = WALLPAPER_GROUPS[group]
+    if repeats_x < 1 or repeats_y < 1:
+        raise ValueError("repeats_x and repeats_y must be at least 1")
+    if scale_x == 0 or (lattice == "rectangular" and scale_y == 0):
+        raise ValueError("scale_x and scale_y must be non-zero")
+    check_copies(len(operations) * repeats_x * repeats_y, max_copies)
+    if lattice == "rectangular":
+        a1, a2 = (scale_x, 0.0), (0.0, scale_y)
+    elif lattice == "square":
+        a1, a2 = (scale_x, 0.0), (0.0, scale_x)
+    else:
+        a1, a2 = (scale_x, 0.0), (-scale_x / 2, scale_x * math.sqrt(3) / 2)
+    det = a1[0] * a2[1] - a2[0] * a1[1]
+    transforms = []
+    for (a, b, c, d, tx, ty) in operations:
+        # Change of basis from lattice to world coordinates: B * op * B^-1
+        la = [[a, b], [c, d]]
+        basis = [[a1[0], a2[0]], [a1[1], a2[1]]]
+        inverse = [[a2[1] / det, -a2[0] / det], [-a1[1] / det, a1[0] / det]]
+        bl = [[sum(basis[i][k] * la[k][j] for k in range(2)) for j in range(2)] for i in range(2)]
+        m = [[sum(bl[i][k] * inverse[k][j] for k in range(2)) for j in range(2)] for i in range(2)]
+        for i in range(repeats_x):
+            for j in range(repeats_y):
+                fx, fy = tx + i, ty + j
+                transforms.append([[m[0][0], m[0][1], 0.0, fx * a1[0] + fy * a2[0]],
+                                   [m[1][0], m[1][1], 0.0, fx * a1[1] + fy * a2[1]],
+                                   [0.0, 0.0, 1.0, 0.0]])
+    return transforms
+
+
+def curve_array(curve: List[List[float]], count: int, align: bool,
+                max_copies: int = MAX_SYMMETRY_COPIES) -> List[Affine]:
+    """Transforms placing count copies evenly along a polyline, X axis following the tangent if align"""
+    points = [tuple(float(c) for c in point[:3]) for point in curve]
+    if len(points) < 2 or count < 1:
+        raise ValueError("Curve needs at least 2 points and count at least 1")
+    check_copies(count, max_copies)
+    segments = [math.dist(points[i], points[i + 1]) for i in range(len(points) - 1)]
+    total = sum(segments)
+    transforms = []
+    for copy in range(count):
+        target = total * copy / (count - 1) if count > 1 else 0.0
+        index = 0
+        while index < len(segments) - 1 and target > segments[index]:
+            target -= segments[index]
+            index += 1
+        start, end = points[index], points[index + 1]
+        t = target / segments[index] if segments[index] else 0.0
+        position = [start[k] + (end[k] - start[k]) * t for k in range(3)]
+        m = [[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]
+        if align and segments[index]:
+            tangent = [(end[k] - start[k]) / segments[index] for k in range(3)]
+            axis = (0.0, -tangent[2], tangent[1])  # cross product of X and tangent
+            if math.sqrt(axis[1] ** 2 + axis[2] ** 2) > 1e-9:
+                m = rotation(axis, math.acos(max(-1.0, min(1.0, tangent[0]))))
+            elif tangent[0] < 0:
+                m = rotation((0, 1, 0), math.pi)
+        for k in range(3):
+            m[k][3] = position[k]
+        transforms.append(m)
+    return transforms
+
+
+def transform_paths(paths: List[List[List[float]]], transforms: List[Affine]) -> List[List[List[float]]]:
+    """Applies every transform to every path, rounding coordinates to keep the request small"""
+    points = [(float(p[0]), float(p[1]), float(p[2])) for path in paths for p in path]
+    lengths = [len(path) for path in paths]
+    result = []
+    for m in transforms:
+        moved = [[round(m[i][0] * x + m[i][1] * y + m[i][2] * z + m[i][3], 4) + 0.0 for i in range(3)]
+                 for (x, y, z) in points]
+        offset = 0
+        for length in lengths:
+            result.append(moved[offset:offset + length])
+            offset += length
+    return result
+
+
+def parse_paths(paths: str) -> List[List[List[float]]]:
+    """
+    Parses paths in draw.paths format, with or without the outer brackets
+    (`[[0,0,0],[1,0,0]],[[0,0,-1],[1,0,-1]]`), or a single path (`[[0,0,0],[1,0,0]]`)
+    """
+    error = "paths must be a list of lists of [x,y,z]"
+    try:
+        parsed = json.loads(paths)
+    except ValueError:
+        try:
+            parsed = json.loads(f"[{paths}]")
+        except ValueError:
+            raise ValueError(error)
+    if isinstance(parsed, list) and parsed and isinstance(parsed[0], list) and parsed[0] \
+            and isinstance(parsed[0][0], (int, float)):
+        parsed = [parsed]
+    if not isinstance(parsed, list) or not parsed:
+        raise ValueError(error)
+    for path in parsed:
+        if not isinstance(path, list) or not path:
+            raise ValueError(error)
+        for point in path:
+            if (not isinstance(point, list) or len(point) < 3
+                    or not all(isinstance(c, (int, float)) for c in point[:3])):
+                raise ValueError(error)
+    return parsed
+
+
+def draw_expanded(tool_name: str, paths: str, build: Any) -> ToolResponse:
+    """
+    Expands paths with the transforms returned by build(max_copies) and draws them in one
+    draw.paths call; build rejects oversized expansions before creating any transform
+    """
+    try:
+        motif = parse_paths(paths)
+        points = sum(len(path) for path in motif)
+        transforms = build(min(MAX_SYMMETRY_COPIES, MAX_EXPANDED_POINTS // points))
+        expanded = transform_paths(motif, transforms)
+    except (ValueError, TypeError, IndexError) as e:
+        return format_response(tool_name, "draw.paths", -1, 0.0, body=f"Error: {str(e)}")
+    params = {"draw.paths": json.dumps(expanded, separators=(",", ":"))}
+    return execute_command(tool_name, params)
+
+
 ### Drawing commands
 @mcp.tool()
-def draw_paths(paths: str) -> str:
+def draw_paths(paths: str) -> ToolResponse:
     """Draws a series of paths at the current brush position"""
     params = {"draw.paths": paths}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: draw_paths"
-    else:
-        return f"✗ Failed (HTTP {status_code}): draw_paths"
+    return execute_command("draw_paths", params)
 
 
 @mcp.tool()
-def draw_path(path: str) -> str:
+def draw_path(path: str) -> ToolResponse:
     """Draws a path at the current brush position using comma-separated XYZ triplets (e.g. `[0,0,0],[0,1,0]`), not an SVG path string"""
     params = {"draw.path": path}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: draw_path"
-    else:
-        return f"✗ Failed (HTTP {status_code}): draw_path"
+    return execute_command("draw_path", params)
 
 
 @mcp.tool()
-def draw_stroke(stroke: str) -> str:
+def draw_stroke(stroke: str) -> ToolResponse:
     """Draws an exact stroke with orientation and pressure"""
     params = {"draw.stroke": stroke}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: draw_stroke"
-    else:
-        return f"✗ Failed (HTTP {status_code}): draw_stroke"
+    return execute_command("draw_stroke", params)
 
 
 @mcp.tool()
-def draw_polygon(sides: int, radius: float, angle: float) -> str:
+def draw_polygon(sides: int, radius: float, angle: float) -> ToolResponse:
     """Draws a polygon at the current brush position"""
     params = {"draw.polygon": f"{sides},{radius},{angle}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: draw_polygon"
-    else:
-        return f"✗ Failed (HTTP {status_code}): draw_polygon"
+    return execute_command("draw_polygon", params)
 
 
 # Brush commands
 @mcp.tool()
-def brush_set_type(brush_type: str) -> str:
+def brush_set_type(brush_type: str) -> ToolResponse:
     """Change brush type"""
     params = {"brush.type": brush_type}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_set_type"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_set_type"
+    return execute_command("brush_set_type", params)
 
 
 @mcp.tool()
-def brush_set_size(size: float) -> str:
+def brush_set_size(size: float) -> ToolResponse:
     """Sets brush size"""
     params = {"brush.size.set": str(size)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_set_size"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_set_size"
+    return execute_command("brush_set_size", params)
 
 
 @mcp.tool()
-def brush_add_size(amount: float) -> str:
+def brush_add_size(amount: float) -> ToolResponse:
     """Modifies brush size by an amount"""
     params = {"brush.size.add": str(amount)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_add_size"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_add_size"
+    return execute_command("brush_add_size", params)
 
 
 @mcp.tool()
-def brush_set_path_smoothing(amount: float) -> str:
+def brush_set_path_smoothing(amount: float) -> ToolResponse:
     """Sets brush path smoothing (0-1, default 0.1)"""
     params = {"brush.pathsmoothing": str(amount)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_set_path_smoothing"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_set_path_smoothing"
+    return execute_command("brush_set_path_smoothing", params)
 
 
 @mcp.tool()
-def brush_move(x: float, y: float, z: float) -> str:
+def brush_move(x: float, y: float, z: float) -> ToolResponse:
     """Moves brush to absolute position"""
     params = {"brush.move.to": f"{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_move"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_move"
+    return execute_command("brush_move", params)
 
 
 @mcp.tool()
-def brush_translate(x: float, y: float, z: float) -> str:
+def brush_translate(x: float, y: float, z: float) -> ToolResponse:
     """Moves brush relatively"""
     params = {"brush.move.by": f"{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_translate"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_translate"
+    return execute_command("brush_translate", params)
 
 
 @mcp.tool()
-def brush_turn(x: float = 0, y: float = 0, z: float = 0) -> str:
+def brush_turn(x: float = 0, y: float = 0, z: float = 0) -> ToolResponse:
     """Turns brush relatively"""
     params = {
         "brush.turn.x": str(x),
         "brush.turn.y": str(y),
         "brush.turn.z": str(z)
     }
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_turn"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_turn"
+    return execute_command("brush_turn", params)
 
 
 @mcp.tool()
-def brush_draw(length: float) -> str:
+def brush_draw(length: float) -> ToolResponse:
     """Draws a straight line of specified length"""
     params = {"brush.draw": str(length)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: brush_draw"
-    else:
-        return f"✗ Failed (HTTP {status_code}): brush_draw"
+    return execute_command("brush_draw", params)
 
 
 # Color commands
 @mcp.tool()
-def color_set_rgb(r: float, g: float, b: float) -> str:
+def color_set_rgb(r: float, g: float, b: float) -> ToolResponse:
     """Sets color in RGB (0-1)"""
     params = {"color.set.rgb": f"{r},{g},{b}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: color_set_rgb"
-    else:
-        return f"✗ Failed (HTTP {status_code}): color_set_rgb"
+    return execute_command("color_set_rgb", params)
 
 
 @mcp.tool()
-def color_set_hsv(h: float, s: float, v: float) -> str:
+def color_set_hsv(h: float, s: float, v: float) -> ToolResponse:
     """Sets color in HSV (0-1)"""
     params = {"color.set.hsv": f"{h},{s},{v}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: color_set_hsv"
-    else:
-        return f"✗ Failed (HTTP {status_code}): color_set_hsv"
+    return execute_command("color_set_hsv", params)
 
 
 @mcp.tool()
-def color_set_html(color: str) -> str:
+def color_set_html(color: str) -> ToolResponse:
     """Sets color with HTML/CSS value"""
     params = {"color.set.html": color}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: color_set_html"
-    else:
-        return f"✗ Failed (HTTP {status_code}): color_set_html"
+    return execute_command("color_set_html", params)
 
 
 @mcp.tool()
-def color_add_rgb(r: float, g: float, b: float) -> str:
+def color_add_rgb(r: float, g: float, b: float) -> ToolResponse:
     """Adds values to current color (RGB)"""
     params = {"color.add.rgb": f"{r},{g},{b}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: color_add_rgb"
-    else:
-        return f"✗ Failed (HTTP {status_code}): color_add_rgb"
+    return execute_command("color_add_rgb", params)
 
 
 @mcp.tool()
-def color_add_hsv(h: float, s: float, v: float) -> str:
+def color_add_hsv(h: float, s: float, v: float) -> ToolResponse:
     """Adds values to current color (HSV)"""
     params = {"color.add.hsv": f"{h},{s},{v}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: color_add_hsv"
-    else:
-        return f"✗ Failed (HTTP {status_code}): color_add_hsv"
+    return execute_command("color_add_hsv", params)
 
 
 # Model commands
 @mcp.tool()
-def model_import(filename: str) -> str:
+def model_import(filename: str) -> ToolResponse:
     """Imports a 3D model from Media Library/Models"""
-    params = {"model.import": filename}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_import"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_import"
+    return execute_import("model_import", "model.import", filename)
 
 
 @mcp.tool()
-def model_web_import(url: str) -> str:
+def model_web_import(url: str) -> ToolResponse:
     """Imports a 3D model from URL or local file"""
-    params = {"model.webimport": url}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_web_import"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_web_import"
+    return execute_import("model_web_import", "model.webimport", url)
 
 
 @mcp.tool()
-def model_icosa_import(model_id: str) -> str:
+def model_icosa_import(model_id: str) -> ToolResponse:
     """Imports a model from Icosa Gallery"""
-    params = {"model.icosaimport": model_id}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_icosa_import"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_icosa_import"
+    return execute_import("model_icosa_import", "model.icosaimport", model_id)
 
 
 @mcp.tool()
-def model_select(index: int) -> str:
+def model_select(index: int) -> ToolResponse:
     """Selects a 3D model by index"""
     params = {"model.select": str(index)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_select"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_select"
+    return execute_command("model_select", params)
 
 
 @mcp.tool()
-def model_position(index: int, x: float, y: float, z: float) -> str:
+def model_position(index: int, x: float, y: float, z: float) -> ToolResponse:
     """Moves a 3D model to given coordinates"""
     params = {"model.position": f"{index},{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_position"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_position"
+    return execute_command("model_position", params)
 
 
 @mcp.tool()
-def model_rotation(index: int, x: float, y: float, z: float) -> str:
+def model_rotation(index: int, x: float, y: float, z: float) -> ToolResponse:
     """Sets a 3D model's rotation"""
     params = {"model.rotation": f"{index},{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_rotation"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_rotation"
+    return execute_command("model_rotation", params)
 
 
 @mcp.tool()
-def model_scale(index: int, scale: float) -> str:
+def model_scale(index: int, scale: float) -> ToolResponse:
     """Sets a 3D model's scale"""
     params = {"model.scale": f"{index},{scale}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_scale"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_scale"
+    return execute_command("model_scale", params)
 
 
 @mcp.tool()
-def model_delete(index: int) -> str:
+def model_delete(index: int) -> ToolResponse:
     """Deletes a 3D model by index"""
     params = {"model.delete": str(index)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: model_delete"
-    else:
-        return f"✗ Failed (HTTP {status_code}): model_delete"
+    return execute_command("model_delete", params)
+
+
+# Image and video commands
+@mcp.tool()
+def image_import(filename: str) -> ToolResponse:
+    """Imports an image from Media Library/Images, duplicating it if already in the scene"""
+    return execute_import("image_import", "image.import", filename)
+
+
+@mcp.tool()
+def video_import(filename: str) -> ToolResponse:
+    """Imports a video from Media Library/Videos"""
+    return execute_import("video_import", "video.import", filename)
+
+
+@mcp.tool()
+def media_import_many(media_type: str, filenames: List[str]) -> ToolResponse:
+    """Imports several media files in one call (media_type: model, image or video)"""
+    if media_type not in MEDIA_FOLDERS:
+        return format_response("media_import_many", f"{media_type}.import", -1, 0.0,
+                               body=f"Unknown media type: {media_type}")
+    return execute_import_many(f"{media_type}.import", filenames)
 
 
 # Save/Load commands
 @mcp.tool()
-def save_overwrite() -> str:
+def save_overwrite() -> ToolResponse:
     """Saves the scene by overwriting the last save"""
     params = {"save.overwrite": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: save_overwrite"
-    else:
-        return f"✗ Failed (HTTP {status_code}): save_overwrite"
+    return execute_command("save_overwrite", params)
 
 
 @mcp.tool()
-def save_as(filename: str) -> str:
+def save_as(filename: str) -> ToolResponse:
     """Saves the scene with a new name"""
     params = {"save.as": filename}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: save_as"
-    else:
-        return f"✗ Failed (HTTP {status_code}): save_as"
+    return execute_command("save_as", params)
 
 
 @mcp.tool()
-def save_new() -> str:
+def save_new() -> ToolResponse:
     """Saves the scene in a new slot"""
     params = {"save.new": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: save_new"
-    else:
-        return f"✗ Failed (HTTP {status_code}): save_new"
+    return execute_command("save_new", params)
 
 
 @mcp.tool()
-def load_user(slot: int) -> str:
+def load_user(slot: int) -> ToolResponse:
     """Loads a sketch from user folder by index"""
     params = {"load.user": str(slot)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: load_user"
-    else:
-        return f"✗ Failed (HTTP {status_code}): load_user"
+    return execute_command("load_user", params)
 
 
 @mcp.tool()
-def load_named(filename: str) -> str:
+def load_named(filename: str) -> ToolResponse:
     """Loads a sketch by name from user folder"""
     params = {"load.named": filename}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: load_named"
-    else:
-        return f"✗ Failed (HTTP {status_code}): load_named"
+    return execute_command("load_named", params)
 
 
 @mcp.tool()
-def new_scene() -> str:
+def new_scene() -> ToolResponse:
     """Creates a new empty scene"""
     params = {"new": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: new_scene"
-    else:
-        return f"✗ Failed (HTTP {status_code}): new_scene"
+    return execute_command("new_scene", params)
 
 
 # Camera commands
 @mcp.tool()
-def camera_move(x: float, y: float, z: float) -> str:
+def camera_move(x: float, y: float, z: float) -> ToolResponse:
     """Moves camera to absolute position"""
     params = {"user.move.to": f"{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: camera_move"
-    else:
-        return f"✗ Failed (HTTP {status_code}): camera_move"
+    return execute_command("camera_move", params)
 
 
 @mcp.tool()
-def camera_translate(x: float, y: float, z: float) -> str:
+def camera_translate(x: float, y: float, z: float) -> ToolResponse:
     """Moves camera relatively"""
     params = {"user.move.by": f"{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: camera_translate"
-    else:
-        return f"✗ Failed (HTTP {status_code}): camera_translate"
+    return execute_command("camera_translate", params)
 
 
 @mcp.tool()
-def camera_rotate(x: float, y: float, z: float) -> str:
+def camera_rotate(x: float, y: float, z: float) -> ToolResponse:
     """Sets camera rotation"""
     params = {"user.direction": f"{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: camera_rotate"
-    else:
-        return f"✗ Failed (HTTP {status_code}): camera_rotate"
+    return execute_command("camera_rotate", params)
 
 
 @mcp.tool()
-def camera_turn(x: float = 0, y: float = 0, z: float = 0) -> str:
+def camera_turn(x: float = 0, y: float = 0, z: float = 0) -> ToolResponse:
     """Turns camera relatively"""
     params = {
         "user.turn.x": str(x),
         "user.turn.y": str(y),
         "user.turn.z": str(z)
     }
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: camera_turn"
-    else:
-        return f"✗ Failed (HTTP {status_code}): camera_turn"
+    return execute_command("camera_turn", params)
 
 
 @mcp.tool()
-def spectator_move(x: float, y: float, z: float) -> str:
+def spectator_move(x: float, y: float, z: float) -> ToolResponse:
     """Moves spectator camera"""
     params = {"spectator.move.to": f"{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: spectator_move"
-    else:
-        return f"✗ Failed (HTTP {status_code}): spectator_move"
+    return execute_command("spectator_move", params)
 
 
 # Selection commands
 @mcp.tool()
-def selection_select_all() -> str:
+def selection_select_all() -> ToolResponse:
     """Selects all strokes"""
     params = {"select.all": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: selection_select_all"
-    else:
-        return f"✗ Failed (HTTP {status_code}): selection_select_all"
+    return execute_command("selection_select_all", params)
 
 
 @mcp.tool()
-def selection_invert() -> str:
+def selection_invert() -> ToolResponse:
     """Inverts selection"""
     params = {"selection.invert": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: selection_invert"
-    else:
-        return f"✗ Failed (HTTP {status_code}): selection_invert"
+    return execute_command("selection_invert", params)
 
 
 @mcp.tool()
-def selection_delete() -> str:
+def selection_delete() -> ToolResponse:
     """Deletes current selection"""
     params = {"selection.delete": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: selection_delete"
-    else:
-        return f"✗ Failed (HTTP {status_code}): selection_delete"
+    return execute_command("selection_delete", params)
 
 
 @mcp.tool()
-def selection_duplicate() -> str:
+def selection_duplicate() -> ToolResponse:
     """Duplicates current selection"""
     params = {"selection.duplicate": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: selection_duplicate"
-    else:
-        return f"✗ Failed (HTTP {status_code}): selection_duplicate"
+    return execute_command("selection_duplicate", params)
 
 
 # Layer commands
 @mcp.tool()
-def layer_create() -> str:
+def layer_create() -> ToolResponse:
     """Creates a new layer"""
     params = {"layer.add": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: layer_create"
-    else:
-        return f"✗ Failed (HTTP {status_code}): layer_create"
+    return execute_command("layer_create", params)
 
 
 @mcp.tool()
-def layer_set(layer: int) -> str:
+def layer_set(layer: int) -> ToolResponse:
     """Sets active layer"""
     params = {"layer.activate": str(layer)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: layer_set"
-    else:
-        return f"✗ Failed (HTTP {status_code}): layer_set"
+    return execute_command("layer_set", params)
 
 
 @mcp.tool()
-def layer_show(layer: int) -> str:
+def layer_show(layer: int) -> ToolResponse:
     """Shows a layer"""
     params = {"layer.show": str(layer)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: layer_show"
-    else:
-        return f"✗ Failed (HTTP {status_code}): layer_show"
+    return execute_command("layer_show", params)
 
 
 @mcp.tool()
-def layer_hide(layer: int) -> str:
+def layer_hide(layer: int) -> ToolResponse:
     """Hides a layer"""
     params = {"layer.hide": str(layer)}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: layer_hide"
-    else:
-        return f"✗ Failed (HTTP {status_code}): layer_hide"
+    return execute_command("layer_hide", params)
 
 
 # Guide commands
 @mcp.tool()
-def guide_add(guide_type: str) -> str:
+def guide_add(guide_type: str) -> ToolResponse:
     """Adds a guide to the scene"""
     params = {"guide.add": guide_type}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: guide_add"
-    else:
-        return f"✗ Failed (HTTP {status_code}): guide_add"
+    return execute_command("guide_add", params)
 
 
 @mcp.tool()
-def guide_position(index: int, x: float, y: float, z: float) -> str:
+def guide_position(index: int, x: float, y: float, z: float) -> ToolResponse:
     """Moves a guide to given coordinates"""
     params = {"guide.position": f"{index},{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: guide_position"
-    else:
-        return f"✗ Failed (HTTP {status_code}): guide_position"
+    return execute_command("guide_position", params)
 
 
 @mcp.tool()
-def guide_scale(index: int, x: float, y: float, z: float) -> str:
+def guide_scale(index: int, x: float, y: float, z: float) -> ToolResponse:
     """Sets non-uniform scale of a guide"""
     params = {"guide.scale": f"{index},{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: guide_scale"
-    else:
-        return f"✗ Failed (HTTP {status_code}): guide_scale"
+    return execute_command("guide_scale", params)
 
 
 # Symmetry commands
 @mcp.tool()
-def symmetry_mode(mode: str) -> str:
+def symmetry_mode(mode: str) -> ToolResponse:
     """Sets symmetry mode"""
     params = {"symmetry.mode": mode}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: symmetry_mode"
-    else:
-        return f"✗ Failed (HTTP {status_code}): symmetry_mode"
+    return execute_command("symmetry_mode", params)
 
 
 @mcp.tool()
-def symmetry_position(x: float, y: float, z: float) -> str:
+def symmetry_position(x: float, y: float, z: float) -> ToolResponse:
     """Moves symmetry widget"""
     params = {"symmetry.position": f"{x},{y},{z}"}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: symmetry_position"
-    else:
-        return f"✗ Failed (HTTP {status_code}): symmetry_position"
+    return execute_command("symmetry_position", params)
+
+
+@mcp.tool()
+def draw_point_symmetry(paths: str, group: str) -> ToolResponse:
+    """Draws paths (draw_paths format) repeated by a point group: Cn (radial n-fold), Cnv, Cnh, Dn, Dnh, Dnd, T, Td, Th, O, Oh, I, Ih"""
+    return draw_expanded("draw_point_symmetry", paths, lambda max_copies: point_group(group, max_copies))
+
+
+@mcp.tool()
+def draw_wallpaper(paths: str, group: str, repeats_x: int = 3, repeats_y: int = 3,
+                   scale_x: float = 1.0, scale_y: float = 1.0) -> ToolResponse:
+    """Draws paths (draw_paths format) tiled in the XY plane by one of the 17 wallpaper groups (p1, p2, pm, pg, cm, pmm, pmg, pgg, cmm, p4, p4m, p4g, p3, p3m1, p31m, p6, p6m)"""
+    return draw_expanded("draw_wallpaper", paths,
+                         lambda max_copies: wallpaper_group(group, repeats_x, repeats_y, scale_x, scale_y, max_copies))
+
+
+@mcp.tool()
+def draw_along_curve(paths: str, curve: str, count: int, align: bool = True) -> ToolResponse:
+    """Draws count copies of paths (draw_paths format) evenly spaced along a curve of XYZ points (e.g. `[[0,0,0],[5,0,0]]`)"""
+    return draw_expanded("draw_along_curve", paths, lambda max_copies: curve_array(json.loads(curve), count, align, max_copies))
 
 
 # Utility commands
 @mcp.tool()
-def undo() -> str:
+def undo() -> ToolResponse:
     """Undoes last action"""
     params = {"undo": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: undo"
-    else:
-        return f"✗ Failed (HTTP {status_code}): undo"
+    return execute_command("undo", params)
 
 
 @mcp.tool()
-def redo() -> str:
+def redo() -> ToolResponse:
     """Redoes last undone action"""
     params = {"redo": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: redo"
-    else:
-        return f"✗ Failed (HTTP {status_code}): redo"
+    return execute_command("redo", params)
 
 
 @mcp.tool()
-def show_help() -> str:
+def show_help() -> ToolResponse:
     """Shows API help"""
     params = {"help": None}
-    status_code, url =  call_openbrush_api(params)
-    if status_code == 200:
-        return "✓ Command executed: show_help"
-    else:
-        return f"✗ Failed (HTTP {status_code}): show_help"
+    return execute_command("show_help", params, include_body=True)
+
+@mcp.tool()
+def batch(commands: List[str]) -> ToolResponse:
+    """Runs several raw API commands in order (e.g. `["brush.move.to=0,0,0", "draw.path=[0,0,0],[0,1,0]"]`) and returns one summary"""
+    pairs = []
+    for command in commands:
+        commandname, _, parameters = command.partition("=")
+        pairs.append((commandname, parameters))
+    return execute_batch(pairs)
+
+
+@mcp.tool()
+def set_compact_responses(enabled: bool) -> ToolResponse:
+    """
+    Switches tool results between verbose strings and compact {"s","c","ms"} dicts
+    Its own reply is {"s": 200, "compact": 1}: no API command is sent, so it has no c or ms
+    """
+    global COMPACT_RESPONSES
+    COMPACT_RESPONSES = enabled
+    if enabled:
+        return {"s": 200, "compact": 1}
+    return "✓ Compact responses disabled"
 
 if __name__ == "__main__":
     mcp.run()
@@ -0,0 +1,102 @@
+"""
+Tests for the server-side symmetry expansion (pure functions, no Open Brush needed)
+Run with: python -m pytest tests
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import openbrush_mcp_server as server
+
+
+POINT_GROUP_ORDERS = {
+    "C1": 1, "C6": 6, "C4v": 8, "C3h": 6,
+    "D4": 8, "D4h": 16, "D3d": 12, "D2d": 8,
+    "T": 12, "Td": 24, "Th": 24, "O": 24, "Oh": 48, "I": 60, "Ih": 120,
+}
+
+
+def is_orthogonal(m):
+    for i in range(3):
+        for j in range(3):
+            dot = sum(m[k][i] * m[k][j] for k in range(3))
+            if abs(dot - (1.0 if i == j else 0.0)) > 1e-9:
+                return False
+    return True
+
+
+@pytest.mark.parametrize("group,order", POINT_GROUP_ORDERS.items())
+def test_point_group_order(group, order):
+    transforms = server.point_group(group)
+    assert len(transforms) == order
+    assert all(is_orthogonal(m) for m in transforms)
+
+
+@pytest.mark.parametrize("group", ["C2d", "C4d", "D3v", "C0", "X", "C20000"])
+def test_point_group_rejects_invalid(group):
+    with pytest.raises(ValueError):
+        server.point_group(group)
+
+
+@pytest.mark.parametrize("group", server.WALLPAPER_GROUPS)
+def test_wallpaper_operations_closed_modulo_lattice(group):
+    lattice, operations = server.WALLPAPER_GROUPS[group]
+    key = lambda o: (o[0], o[1], o[2], o[3], round(o[4] % 1, 6), round(o[5] % 1, 6))
+    keys = {key(o) for o in operations}
+    assert len(keys) == len(operations)
+    for (a, b, c, d, tx, ty) in operations:
+        for (e, f, g, h, ux, uy) in operations:
+            product = (a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h,
+                       a * ux + b * uy + tx, c * ux + d * uy + ty)
+            assert key(product) in keys
+
+
+@pytest.mark.parametrize("group", server.WALLPAPER_GROUPS)
+def test_wallpaper_transforms_are_isometries(group):
+    transforms = server.wallpaper_group(group, 2, 2, 1.5, 1.5)
+    assert len(transforms) == 4 * len(server.WALLPAPER_GROUPS[group][1])
+    assert all(is_orthogonal(m) for m in transforms)
+
+
+def test_wallpaper_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        server.wallpaper_group("p1", 0, 3, 1.0, 1.0)
+    with pytest.raises(ValueError):
+        server.wallpaper_group("p1", 3, 3, 0.0, 1.0)
+    with pytest.raises(ValueError):
+        server.wallpaper_group("pmm", 3, 3, 1.0, 0.0)
+
+
+def test_curve_array_endpoints():
+    curve = [[0, 0, 0], [2, 0, 0], [2, 0, 2]]
+    transforms = server.curve_array(curve, 3, align=True)
+    positions = [[m[k][3] for k in range(3)] for m in transforms]
+    assert positions[0] == pytest.approx([0, 0, 0])
+    assert positions[1] == pytest.approx([2, 0, 0])
+    assert positions[2] == pytest.approx([2, 0, 2])
+    # Last copy follows the second segment: local X points along +Z
+    assert [transforms[2][k][0] for k in range(3)] == pytest.approx([0, 0, 1])
+
+
+def test_parse_paths_accepts_draw_paths_forms():
+    expected = [[[0, 0, 0], [1, 0, 0]], [[0, 0, -1], [1, 0, -1]]]
+    assert server.parse_paths("[[0,0,0],[1,0,0]],[[0,0,-1],[1,0,-1]]") == expected
+    assert server.parse_paths("[[[0,0,0],[1,0,0]],[[0,0,-1],[1,0,-1]]]") == expected
+    assert server.parse_paths("[[0,0,0],[1,0,0]]") == [[[0, 0, 0], [1, 0, 0]]]
+    for bad in ["", "[1,2,3]", "[[[0,0]]]", "nope"]:
+        with pytest.raises(ValueError, match="list of lists"):
+            server.parse_paths(bad)
+
+
+def test_limits_checked_before_building():
+    with pytest.raises(ValueError, match="copies exceed"):
+        server.point_group("D300h", max_copies=100)
+    with pytest.raises(ValueError, match="copies exceed"):
+        server.wallpaper_group("p6m", 20, 20, 1.0, 1.0)
+    with pytest.raises(ValueError, match="copies exceed"):
+        server.curve_array([[0, 0, 0], [1, 0, 0]], 5000, align=False)